@@ -124,8 +124,8 @@ class HiscoresRolesBot(interactions.Extension):
         embed = message.embeds[0]
 
         new_record = NewRecord.from_webhook(embed)
-        configured_users = self.user_settings.get_users()
-        new_record.set_player_ids(configured_users)
+        users_by_name = self.user_settings.get_users_by_hiscores_names(new_record.players)
+        new_record.set_player_ids(users_by_name)
 
         await self.client._http.send_message(BOT_SETTINGS.new_record.channel, str(new_record))
         await self.client._http.edit_webhook_message(message.webhook_id, WEBHOOK_TOKEN, message.id,
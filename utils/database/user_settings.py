@@ -39,14 +39,23 @@ class UserSettings(DatabaseClient):
         with self._database.query(User) as conn:
             return conn.execute("SELECT * FROM users WHERE hiscores_name = %s", (hiscores_name,)).fetchone()
 
+    def get_users_by_hiscores_names(self, hiscores_names):
+        """Map each hiscores name to its linked user (case insensitive) in a single query.
+        Names are lowered and matched by the database only. When several users match a name the exact spelling
+        is preferred, then the lowest user_id.
+        Needs an expression index on lower(hiscores_name) to avoid scanning the users table.
+        """
+        with self._database.query() as conn:
+            rows = conn.execute("""
+            SELECT DISTINCT ON (name) name, user_id, hiscores_name
+            FROM unnest(%s::text[]) AS name
+            JOIN users ON lower(hiscores_name) = lower(name)
+            ORDER BY name, hiscores_name <> name, user_id
+            """, (list(hiscores_names),)).fetchall()
+        return {name: User(user_id, hiscores_name) for name, user_id, hiscores_name in rows}
+
     @staticmethod
     def find_user_by_id(user_id, users):
         for user in users:
             if user_id == user.user_id:
                 return user
-
-    @staticmethod
-    def find_user_by_hiscores_name(hiscores_name, users):
-        for user in users:
-            if hiscores_name == user.hiscores_name:
-                return user
@@ -2,7 +2,10 @@ from dataclasses import dataclass
 
 import interactions
 
-from utils.database.user_settings import UserSettings
+
+PLACE_ORDINALS = ('1st', '2nd', '3rd')
+WEBHOOK_SENT_DESCRIPTION = "Sent :ballot_box_with_check:"
+WEBHOOK_SENT_COLOR = 0x0693E3
 
 
 @dataclass
@@ -38,15 +41,15 @@ class NewRecord:
     @staticmethod
     def webhook_sent_embed(embed):
         return interactions.Embed(title=embed.title, fields=embed.fields,
-                                  description="Sent :ballot_box_with_check:", color=0x0693E3)
+                                  description=WEBHOOK_SENT_DESCRIPTION, color=WEBHOOK_SENT_COLOR)
 
-    def set_player_ids(self, users):
+    def set_player_ids(self, users_by_name):
         for index, player in enumerate(self.players):
-            if user := UserSettings.find_user_by_hiscores_name(player, users):
+            if user := users_by_name.get(player):
                 self.players[index] = f"<@{user.user_id}>"
 
     def __str__(self):
-        place_ordinal = ['1st', '2nd', '3rd'][self.place-1]
+        place_ordinal = PLACE_ORDINALS[self.place-1]
 
         formatted = f"{place_ordinal} place {self.team_size} {self.boss} - {self.boss_mode} - {self.time} has been achieved by {', '.join(self.players)} "
 